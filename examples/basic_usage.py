@@ -1,9 +1,14 @@
 """Ejemplo básico de uso de RaveXRPC."""
 
-import asyncio
-
 from ravexrpc import RPC_Client
 
+try:
+    # uvloop (extra [speed]) acelera el event loop 2-4x en I/O de red;
+    # si no está instalado (p. ej. en Windows) se usa asyncio.run
+    from uvloop import run
+except ImportError:
+    from asyncio import run
+
 
 async def get_token_accounts_example():
     # Inicializar el cliente (mainnet por defecto)
@@ -69,4 +74,4 @@ async def main():
 
 if __name__ == "__main__":
     print("🚀 RaveXRPC - Ejemplo de uso\n")
-    asyncio.run(main())
+    run(main())
@@ -5,6 +5,13 @@ import asyncio
 from ravexrpc import RPC_Client
 from ravexrpc.exceptions import RPCException
 
+try:
+    # uvloop (extra [speed]) acelera el event loop 2-4x en I/O de red;
+    # si no está instalado (p. ej. en Windows) se usa asyncio.run
+    from uvloop import run
+except ImportError:
+    from asyncio import run
+
 
 async def handle_errors_example():
     """Demuestra el manejo correcto de errores."""
@@ -76,9 +83,9 @@ if __name__ == "__main__":
     print("🚀 RaveXRPC - Ejemplos de manejo de errores\n")
     print("=" * 60 + "\n")
 
-    asyncio.run(handle_errors_example())
+    run(handle_errors_example())
 
     print("\n" + "=" * 60)
     print("\n5️⃣  Ejemplo de reintentos con backoff exponencial:\n")
 
-    asyncio.run(retry_with_backoff())
+    run(retry_with_backoff())
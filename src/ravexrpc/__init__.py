@@ -26,6 +26,7 @@ from ravexrpc.exceptions import (
     TransactionNotFoundException,
 )
 from ravexrpc.models import (
+    RPCEnvelope,
     RPCGetBalanceResult,
     RPCGetTokenAccountsByOwnerResult,
     RPCGetTokenAccountsResult,
@@ -35,6 +36,7 @@ from ravexrpc.models import (
     RPCResponse,
     RPCTokenAccounts,
     RPCTransaction,
+    TokenAccountsSoA,
 )
 
 __version__ = "0.1.0"
@@ -54,10 +56,12 @@ __all__ = [
     "RPCGetBalanceResult",
     "RPCGetTransactionResult",
     "RPCTokenAccounts",
+    "TokenAccountsSoA",
     "RPCMetaTransaction",
     "RPCTransaction",
     "RPCMessageModel",
     "RPCResponse",
+    "RPCEnvelope",
 ]
 
 
@@ -0,0 +1,38 @@
+"""Rutas calientes del post-procesado de transacciones.
+
+Las funciones de este módulo concentran los bucles que dominan el coste
+en cargas bulk de getTransaction. Están escritas con tipos simples y sin
+estado de módulo para que el fichero pueda compilarse tal cual con mypyc
+o Cython (el import recoge la extensión compilada si existe, y la versión
+pura de Python sigue funcionando sin ella).
+"""
+
+from typing import cast
+
+import numpy as np
+
+
+def delta_balances(pre: list[int], post: list[int]) -> list[int]:
+    """Resta vectorizada post - pre por cuenta.
+
+    Args:
+        pre: Balances antes de la transacción (lamports).
+        post: Balances después de la transacción (lamports).
+
+    Returns:
+        Lista de cambios de balance, post[i] - pre[i].
+    """
+    delta = np.asarray(post, dtype=np.int64) - np.asarray(pre, dtype=np.int64)
+    return cast(list[int], delta.tolist())
+
+
+def build_key_index(keys: list[str]) -> dict[str, int]:
+    """Construye el índice {clave: posición} de una lista de cuentas.
+
+    Args:
+        keys: Direcciones de cuentas en orden de aparición.
+
+    Returns:
+        Diccionario que resuelve cada clave a su posición en O(1).
+    """
+    return {key: i for i, key in enumerate(keys)}
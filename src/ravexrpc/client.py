@@ -1,11 +1,26 @@
 """Cliente RPC para interactuar con la blockchain de Solana."""
 
-from typing import Literal
-
+import asyncio
+import random
+import re
+import time
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from itertools import count
+from typing import Literal, TypeVar
+
+import httpx
+import orjson
+from cachetools import LRUCache, TTLCache
 from ravexclient import BaseClient
 
-from ravexrpc.exceptions import RPCException
+from ravexrpc.exceptions import (
+    RPCConnectionException,
+    RPCException,
+    RPCTimeoutException,
+)
 from ravexrpc.models import (
+    RPCEnvelope,
     RPCGetBalanceResult,
     RPCGetTokenAccountsByOwnerResult,
     RPCGetTokenAccountsResult,
@@ -17,6 +32,55 @@ EncodingType = Literal["json", "jsonParsed", "base58", "base64"]
 # Niveles de commitment soportados
 CommitmentLevel = Literal["processed", "confirmed", "finalized"]
 
+# Alfabeto base58 de Solana (sin 0, O, I ni l), compilado una sola vez.
+# Rechazar entradas malformadas aquí ahorra el round-trip que el servidor
+# rechazaría de todas formas.
+_BASE58_PUBKEY = re.compile(r"^[1-9A-HJ-NP-Za-km-z]{32,44}$")
+_BASE58_SIGNATURE = re.compile(r"^[1-9A-HJ-NP-Za-km-z]{64,88}$")
+
+# Peso de la última muestra en la media móvil de latencia por endpoint
+_EWMA_ALPHA = 0.3
+
+
+def _retry_after_seconds(header: str | None) -> float:
+    """Convierte una cabecera Retry-After en segundos de espera.
+
+    RFC 9110 permite tanto un número de segundos ("120") como una fecha
+    HTTP ("Fri, 31 Dec 1999 23:59:59 GMT"). Si la cabecera falta o no se
+    puede interpretar, se retorna 0.0 y manda solo el backoff exponencial.
+
+    Args:
+        header: Valor crudo de la cabecera Retry-After, o None.
+
+    Returns:
+        Segundos a esperar, nunca negativos.
+    """
+    if not header:
+        return 0.0
+    try:
+        return max(0.0, float(header))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(header)
+    except ValueError:
+        return 0.0
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=UTC)
+    return max(0.0, (retry_at - datetime.now(UTC)).total_seconds())
+
+
+_T = TypeVar("_T")
+
+# Sobres parametrizados por método, construidos una sola vez en el import
+# para que cada respuesta se parsee y valide en una única pasada Rust.
+# getTransaction usa un sobre de dict porque su modelo necesita inyectar
+# from_pk/to_pk antes de validar.
+_TOKEN_ACCOUNTS_ENVELOPE = RPCEnvelope[RPCGetTokenAccountsResult]
+_TOKEN_ACCOUNTS_BY_OWNER_ENVELOPE = RPCEnvelope[RPCGetTokenAccountsByOwnerResult]
+_BALANCE_ENVELOPE = RPCEnvelope[RPCGetBalanceResult]
+_TRANSACTION_ENVELOPE = RPCEnvelope[dict]
+
 
 class RPC_Client(BaseClient):
     """Cliente para interactuar con el RPC de Solana.
@@ -35,17 +99,44 @@ class RPC_Client(BaseClient):
 
     BASE_URL = "https://api.mainnet-beta.solana.com"
 
+    # Contador compartido de ids JSON-RPC: garantiza ids únicos y crecientes,
+    # necesarios para correlacionar respuestas en peticiones batch
+    _request_ids = count(1)
+
     def __init__(
         self,
-        base_url: str = "https://api.mainnet-beta.solana.com",
+        base_url: str | list[str] = "https://api.mainnet-beta.solana.com",
         timeout: float = 5.0,
+        cache_size: int = 1024,
+        balance_ttl: float = 2.0,
+        max_concurrency: int = 20,
+        max_retries: int = 3,
+        max_connections: int = 100,
+        max_keepalive: int = 50,
     ):
         """Inicializa el cliente RPC de Solana.
 
         Args:
-            base_url: URL del endpoint RPC de Solana. Por defecto usa mainnet-beta.
+            base_url: URL del endpoint RPC de Solana, o lista de URLs.
+                Con varias URLs las lecturas se "hedgean": la misma petición
+                se envía a los dos endpoints con menor latencia y gana la
+                primera respuesta. Por defecto usa mainnet-beta.
             timeout: Tiempo máximo de espera para las peticiones en segundos.
                 Por defecto 30 segundos.
+            cache_size: Número máximo de entradas por caché de lecturas.
+                Por defecto 1024.
+            balance_ttl: Segundos que un balance consultado se considera
+                vigente antes de volver a consultar el RPC. Por defecto 2.0.
+            max_concurrency: Máximo de peticiones en vuelo simultáneas; evita
+                superar el límite de RPS del proveedor en fan-outs grandes.
+                Por defecto 20.
+            max_retries: Reintentos ante respuestas HTTP 429 antes de
+                propagar el error. Por defecto 3.
+            max_connections: Tamaño máximo del pool de conexiones por
+                endpoint. Cargas batch con mucho gather se benefician de
+                subirlo. Por defecto 100.
+            max_keepalive: Conexiones inactivas que se mantienen abiertas
+                para reutilizar. Por defecto 50.
 
         Example:
             >>> # Usar mainnet (por defecto)
@@ -57,7 +148,367 @@ class RPC_Client(BaseClient):
             >>> # Con timeout personalizado
             >>> client = RPC_Client(timeout=60.0)
         """
-        super().__init__(base_url=base_url, timeout=timeout)
+        urls = [base_url] if isinstance(base_url, str) else list(base_url)
+        if not urls:
+            raise ValueError("Se requiere al menos una URL de RPC")
+        super().__init__(base_url=urls[0], timeout=timeout)
+        # Un cliente HTTP compartido por endpoint: reutiliza conexiones
+        # TCP/TLS entre llamadas en lugar de pagar el handshake en cada
+        # petición. HTTP/2 permite multiplexar peticiones concurrentes
+        # sobre una sola conexión.
+        self._https = [
+            httpx.AsyncClient(
+                base_url=url,
+                timeout=timeout,
+                http2=True,
+                limits=httpx.Limits(
+                    max_connections=max_connections,
+                    max_keepalive_connections=max_keepalive,
+                    keepalive_expiry=30.0,
+                ),
+            )
+            for url in urls
+        ]
+        self._http = self._https[0]
+        self._timeout = timeout
+        # Media móvil exponencial de latencia por endpoint; 0.0 significa
+        # "sin muestras", lo que ordena al endpoint primero para que se
+        # pruebe al menos una vez
+        self._latency_ewma = [0.0] * len(self._https)
+        # Cachés para lecturas idempotentes: los balances expiran tras un TTL
+        # corto; las transacciones finalizadas son inmutables, así que solo
+        # se acotan por LRU. Se guarda el modelo ya parseado para no pagar
+        # la validación de pydantic en cada hit.
+        self._balance_cache: TTLCache[tuple[str, str], RPCGetBalanceResult] = TTLCache(
+            maxsize=cache_size, ttl=balance_ttl
+        )
+        self._tx_cache: LRUCache[
+            tuple[str, str, str | None, str | None], RPCGetTransactionResult
+        ] = LRUCache(maxsize=cache_size)
+        # Backpressure: acota las peticiones en vuelo para no superar el
+        # límite de RPS del proveedor cuando se hace asyncio.gather masivo
+        self._sem = asyncio.Semaphore(max_concurrency)
+        self._max_retries = max_retries
+
+    @classmethod
+    def _payload(cls, method: str, params: dict | list) -> dict:
+        """Construye un cuerpo JSON-RPC 2.0 con un id único monotónico.
+
+        Centraliza el esqueleto {"jsonrpc", "id", "method", "params"} que
+        antes se repetía como literal en cada método público.
+
+        Args:
+            method: Nombre del método RPC (p. ej. "getBalance").
+            params: Parámetros del método, en formato lista o dict.
+
+        Returns:
+            Diccionario listo para serializar como petición JSON-RPC.
+        """
+        return {
+            "jsonrpc": "2.0",
+            "id": next(cls._request_ids),
+            "method": method,
+            "params": params,
+        }
+
+    async def _fetch(
+        self, method: str, payload: dict | list[dict] | None = None
+    ) -> bytes:
+        """Envía una petición HTTP al RPC reutilizando el cliente compartido.
+
+        Args:
+            method: Método HTTP a usar (normalmente "POST").
+            payload: Cuerpo JSON-RPC de la petición (dict) o lote de
+                peticiones (lista de dicts).
+
+        Returns:
+            Cuerpo crudo de la respuesta (bytes sin decodificar); la
+            decodificación se fusiona con la validación en _parse.
+
+        Raises:
+            RPCTimeoutException: Si el servidor no responde dentro del timeout.
+            RPCConnectionException: Si no se puede conectar al servidor.
+            RPCException: Si el servidor responde con un código de error HTTP.
+        """
+        # orjson serializa directamente a bytes y parsea varias veces
+        # más rápido que el json de la stdlib
+        content = orjson.dumps(payload)
+        async with self._sem:
+            attempt = 0
+            while True:
+                try:
+                    if len(self._https) == 1:
+                        return await self._post_one(self._http, 0, method, content)
+                    return await self._fetch_hedged(method, content)
+                except httpx.TimeoutException as exc:
+                    raise RPCTimeoutException(
+                        f"El RPC no respondió en {self._timeout} segundos"
+                    ) from exc
+                except httpx.ConnectError as exc:
+                    raise RPCConnectionException(
+                        f"No se pudo conectar al RPC: {self._http.base_url}"
+                    ) from exc
+                except httpx.HTTPStatusError as exc:
+                    status = exc.response.status_code
+                    if status != 429 or attempt >= self._max_retries:
+                        raise RPCException(f"Error HTTP {status} del RPC") from exc
+                    # Rate limit: respetar Retry-After si el proveedor lo
+                    # envía, con backoff exponencial y jitter para no
+                    # sincronizar los reintentos
+                    retry_after = _retry_after_seconds(
+                        exc.response.headers.get("Retry-After")
+                    )
+                    await asyncio.sleep(
+                        retry_after + random.uniform(0, 0.1) * 2**attempt
+                    )
+                    attempt += 1
+
+    def _parse(
+        self, raw: bytes | dict, envelope_cls: type[RPCEnvelope[_T]]
+    ) -> _T | None:
+        """Valida una respuesta JSON-RPC completa en una sola pasada.
+
+        Con bytes crudos (ruta de red) usa model_validate_json, que fusiona
+        el parseo JSON y la validación en pydantic-core; un dict ya
+        decodificado (p. ej. un _fetch mockeado en tests) se valida con
+        model_validate.
+
+        Args:
+            raw: Cuerpo de la respuesta, crudo o ya decodificado.
+            envelope_cls: Sobre parametrizado con el modelo del resultado.
+
+        Returns:
+            El `result` tipado del sobre, o None si el RPC no devolvió uno.
+
+        Raises:
+            RPCException: Si el sobre contiene un error del RPC.
+        """
+        if isinstance(raw, bytes | bytearray):
+            envelope = envelope_cls.model_validate_json(raw)
+        else:
+            envelope = envelope_cls.model_validate(raw)
+
+        if envelope.error is not None:
+            error_msg = envelope.error.get("message", "Error desconocido")
+            raise RPCException(f"Error RPC: {error_msg}")
+        return envelope.result
+
+    async def _post_one(
+        self, http: httpx.AsyncClient, index: int, method: str, content: bytes
+    ) -> bytes:
+        """Envía la petición a un endpoint concreto y actualiza su latencia.
+
+        Args:
+            http: Cliente HTTP del endpoint.
+            index: Posición del endpoint en `self._https`.
+            method: Método HTTP a usar.
+            content: Cuerpo JSON-RPC ya serializado.
+
+        Returns:
+            Cuerpo crudo de la respuesta del RPC.
+        """
+        start = time.monotonic()
+        response = await http.request(
+            method,
+            "",
+            content=content,
+            headers={"Content-Type": "application/json"},
+        )
+        response.raise_for_status()
+        elapsed = time.monotonic() - start
+        previous = self._latency_ewma[index]
+        self._latency_ewma[index] = (
+            elapsed
+            if previous == 0.0
+            else _EWMA_ALPHA * elapsed + (1 - _EWMA_ALPHA) * previous
+        )
+        return response.content
+
+    async def _fetch_hedged(self, method: str, content: bytes) -> bytes:
+        """Envía la misma petición a los dos endpoints más rápidos.
+
+        Gana la primera respuesta exitosa y se cancelan las demás, de modo
+        que la latencia p99 se acerca a la p50 del endpoint más rápido.
+        La EWMA de latencia decide qué dos endpoints participan.
+
+        Args:
+            method: Método HTTP a usar.
+            content: Cuerpo JSON-RPC ya serializado.
+
+        Returns:
+            Cuerpo crudo de la respuesta del RPC.
+        """
+        ranked = sorted(range(len(self._https)), key=lambda i: self._latency_ewma[i])
+        tasks = [
+            asyncio.create_task(self._post_one(self._https[i], i, method, content))
+            for i in ranked[:2]
+        ]
+
+        last_exc: httpx.HTTPError | None = None
+        try:
+            for completed in asyncio.as_completed(tasks):
+                try:
+                    return await completed
+                except httpx.HTTPError as exc:
+                    # Si un endpoint falla, espera al otro antes de rendirse
+                    last_exc = exc
+            if last_exc is None:
+                raise RPCConnectionException(
+                    "Ningún endpoint del RPC devolvió respuesta"
+                )
+            raise last_exc  # ambos endpoints fallaron
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _fetch_batch(self, payloads: list[dict]) -> list[dict]:
+        """Envía varias peticiones JSON-RPC en un único POST (batch).
+
+        JSON-RPC 2.0 permite enviar una lista de peticiones en un solo
+        round-trip. Las respuestas pueden llegar desordenadas, así que se
+        reordenan por `id` para que coincidan con el orden de `payloads`.
+
+        Args:
+            payloads: Lista de cuerpos JSON-RPC, cada uno con un `id` único.
+
+        Returns:
+            Lista de respuestas en el mismo orden que las peticiones.
+
+        Raises:
+            RPCTimeoutException: Si el servidor no responde dentro del timeout.
+            RPCConnectionException: Si no se puede conectar al servidor.
+            RPCException: Si el servidor responde con un código de error HTTP.
+        """
+        if not payloads:
+            return []
+
+        responses = await self._fetch("POST", payload=payloads)
+        if isinstance(responses, bytes | bytearray):
+            responses = orjson.loads(responses)
+
+        # Un batch rechazado por completo llega como un único objeto de
+        # error, no como lista (JSON-RPC 2.0 §6)
+        if isinstance(responses, dict):
+            error = responses.get("error") or {}
+            error_msg = error.get("message", "Error desconocido")
+            raise RPCException(f"Error RPC: {error_msg}")
+
+        by_id = {item.get("id"): item for item in responses}
+        missing = {"error": {"message": "El RPC no devolvió respuesta"}}
+        return [by_id.get(p["id"], missing) for p in payloads]
+
+    async def get_balances(
+        self,
+        pubkeys: list[str],
+        commitment: CommitmentLevel = "finalized",
+    ) -> list[RPCGetBalanceResult]:
+        """Obtiene el balance de varias cuentas en una sola petición batch.
+
+        Args:
+            pubkeys: Direcciones de las cuentas (formato base58).
+            commitment: Nivel de confirmación para consultar los balances.
+                Por defecto "finalized".
+
+        Returns:
+            Lista de RPCGetBalanceResult en el mismo orden que `pubkeys`.
+
+        Raises:
+            ValueError: Si alguna dirección es inválida.
+            RPCException: Si el RPC responde con error para alguna cuenta.
+
+        Example:
+            >>> balances = await client.get_balances(
+            ...     pubkeys=["DYw8jCTfwHNRJhhmFcbXvVDTqWMEVFBX6ZKUmG5CNSKK", ...]
+            ... )
+            >>> for balance in balances:
+            ...     print(balance.value / 1e9)
+        """
+        for pubkey in pubkeys:
+            if not isinstance(pubkey, str) or not _BASE58_PUBKEY.match(pubkey):
+                raise ValueError(
+                    "La dirección de la cuenta debe ser una cadena válida en base58"
+                )
+
+        payloads = [
+            self._payload("getBalance", [pubkey, {"commitment": commitment}])
+            for pubkey in pubkeys
+        ]
+
+        responses = await self._fetch_batch(payloads)
+
+        results = []
+        for pubkey, response in zip(pubkeys, responses, strict=True):
+            if "error" in response:
+                error_msg = response["error"].get("message", "Error desconocido")
+                raise RPCException(f"Error RPC para {pubkey}: {error_msg}")
+            results.append(RPCGetBalanceResult.model_validate(response["result"]))
+        return results
+
+    async def get_transactions(
+        self,
+        signatures: list[str],
+        encoding: EncodingType = "json",
+        commitment: CommitmentLevel = "finalized",
+    ) -> list[RPCGetTransactionResult]:
+        """Obtiene varias transacciones en una sola petición batch.
+
+        Args:
+            signatures: Firmas de las transacciones (formato base58).
+            encoding: Formato de codificación de la respuesta. Por defecto "json".
+            commitment: Nivel de confirmación de las transacciones.
+                Por defecto "finalized".
+
+        Returns:
+            Lista de RPCGetTransactionResult en el mismo orden que `signatures`.
+
+        Raises:
+            ValueError: Si alguna firma es inválida.
+            RPCException: Si el RPC responde con error o alguna transacción
+                no se encuentra.
+        """
+        for signature in signatures:
+            if not isinstance(signature, str) or not _BASE58_SIGNATURE.match(signature):
+                raise ValueError(
+                    "La firma debe ser una cadena válida en base58 (64-88 caracteres)"
+                )
+
+        payloads = [
+            self._payload(
+                "getTransaction",
+                [
+                    signature,
+                    {
+                        "commitment": commitment,
+                        "encoding": encoding,
+                        "maxSupportedTransactionVersion": 0,
+                    },
+                ],
+            )
+            for signature in signatures
+        ]
+
+        responses = await self._fetch_batch(payloads)
+
+        results = []
+        for signature, response in zip(signatures, responses, strict=True):
+            if "error" in response:
+                error_msg = response["error"].get("message", "Error desconocido")
+                raise RPCException(f"Error RPC para {signature}: {error_msg}")
+            if response.get("result") is None:
+                raise RPCException(f"Transacción no encontrada: {signature}")
+            results.append(RPCGetTransactionResult.model_validate(response["result"]))
+        return results
+
+    async def close(self) -> None:
+        """Cierra los clientes HTTP compartidos y libera las conexiones."""
+        for http in self._https:
+            await http.aclose()
+
+    async def __aenter__(self) -> RPC_Client:
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close()
 
     async def get_token_accounts(
         self,
@@ -99,8 +550,10 @@ class RPC_Client(BaseClient):
             ...     mint="EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v"
             ... )
         """
-        if not owner or not isinstance(owner, str):
-            raise ValueError("La dirección del owner debe ser una cadena válida")
+        if not isinstance(owner, str) or not _BASE58_PUBKEY.match(owner):
+            raise ValueError(
+                "La dirección del owner debe ser una cadena válida en base58"
+            )
 
         method = "getTokenAccounts"
         params = {
@@ -115,20 +568,14 @@ class RPC_Client(BaseClient):
         if mint is not None:
             params["mint"] = mint
 
-        payload = {
-            "jsonrpc": "2.0",
-            "id": 1,
-            "method": method,
-            "params": params,
-        }
+        payload = self._payload(method, params)
 
-        result = await self._fetch("POST", payload=payload)
+        raw = await self._fetch("POST", payload=payload)
 
-        if "error" in result:
-            error_msg = result["error"].get("message", "Error desconocido")
-            raise RPCException(f"Error RPC: {error_msg}")
-
-        return RPCGetTokenAccountsResult(**result["result"])
+        result = self._parse(raw, _TOKEN_ACCOUNTS_ENVELOPE)
+        if result is None:
+            raise RPCException("Respuesta RPC sin resultado")
+        return result
 
     async def get_transaction(
         self,
@@ -175,11 +622,16 @@ class RPC_Client(BaseClient):
             ... )
             >>> print(f"SOL enviado: {tx.send_sol_amount / 1e9} SOL")
         """
-        if not isinstance(signature, str) or len(signature) < 20:
+        if not isinstance(signature, str) or not _BASE58_SIGNATURE.match(signature):
             raise ValueError(
-                "La firma debe ser una cadena válida de al menos 20 caracteres"
+                "La firma debe ser una cadena válida en base58 (64-88 caracteres)"
             )
 
+        # Una transacción finalizada es inmutable: se puede cachear sin TTL
+        cache_key = (signature, encoding, from_pk, to_pk)
+        if commitment == "finalized" and cache_key in self._tx_cache:
+            return self._tx_cache[cache_key]
+
         method = "getTransaction"
         params = [
             signature,
@@ -189,27 +641,20 @@ class RPC_Client(BaseClient):
                 "maxSupportedTransactionVersion": 0,
             },
         ]
-        payload = {
-            "jsonrpc": "2.0",
-            "id": 1,
-            "method": method,
-            "params": params,
-        }
+        payload = self._payload(method, params)
 
-        result = await self._fetch("POST", payload=payload)
-
-        if "error" in result:
-            error_msg = result["error"].get("message", "Error desconocido")
-            raise RPCException(f"Error RPC: {error_msg}")
+        raw = await self._fetch("POST", payload=payload)
 
-        if result.get("result") is None:
+        result = self._parse(raw, _TRANSACTION_ENVELOPE)
+        if result is None:
             raise RPCException(f"Transacción no encontrada: {signature}")
 
-        return RPCGetTransactionResult(
-            **result["result"],
-            from_pk=from_pk,
-            to_pk=to_pk,
+        transaction = RPCGetTransactionResult.model_validate(
+            {**result, "from_pk": from_pk, "to_pk": to_pk}
         )
+        if commitment == "finalized":
+            self._tx_cache[cache_key] = transaction
+        return transaction
 
     async def get_token_accounts_by_owner(
         self,
@@ -236,8 +681,10 @@ class RPC_Client(BaseClient):
             ValueError: Si `owner` no es válido.
             RPCException: Si el RPC responde con error.
         """
-        if not owner or not isinstance(owner, str):
-            raise ValueError("La dirección del owner debe ser una cadena válida")
+        if not isinstance(owner, str) or not _BASE58_PUBKEY.match(owner):
+            raise ValueError(
+                "La dirección del owner debe ser una cadena válida en base58"
+            )
 
         method = "getTokenAccountsByOwner"
 
@@ -246,20 +693,14 @@ class RPC_Client(BaseClient):
         options = {"commitment": commitment, "encoding": encoding}
         params = [owner, filter_obj or {}, options]
 
-        payload = {
-            "jsonrpc": "2.0",
-            "id": 1,
-            "method": method,
-            "params": params,
-        }
-
-        result = await self._fetch("POST", payload=payload)
+        payload = self._payload(method, params)
 
-        if "error" in result:
-            error_msg = result["error"].get("message", "Error desconocido")
-            raise RPCException(f"Error RPC: {error_msg}")
+        raw = await self._fetch("POST", payload=payload)
 
-        return RPCGetTokenAccountsByOwnerResult(**result["result"])
+        result = self._parse(raw, _TOKEN_ACCOUNTS_BY_OWNER_ENVELOPE)
+        if result is None:
+            raise RPCException("Respuesta RPC sin resultado")
+        return result
 
     async def get_balance(
         self,
@@ -286,22 +727,23 @@ class RPC_Client(BaseClient):
             ... )
             >>> print(f"Balance: {balance / 1e9} SOL")
         """
-        if not pubkey or not isinstance(pubkey, str):
-            raise ValueError("La dirección de la cuenta debe ser una cadena válida")
+        if not isinstance(pubkey, str) or not _BASE58_PUBKEY.match(pubkey):
+            raise ValueError(
+                "La dirección de la cuenta debe ser una cadena válida en base58"
+            )
+
+        cache_key = (pubkey, commitment)
+        if cache_key in self._balance_cache:
+            return self._balance_cache[cache_key]
 
         method = "getBalance"
         params = [pubkey, {"commitment": commitment}]
-        payload = {
-            "jsonrpc": "2.0",
-            "id": 1,
-            "method": method,
-            "params": params,
-        }
+        payload = self._payload(method, params)
 
-        result = await self._fetch("POST", payload=payload)
-
-        if "error" in result:
-            error_msg = result["error"].get("message", "Error desconocido")
-            raise RPCException(f"Error RPC: {error_msg}")
+        raw = await self._fetch("POST", payload=payload)
 
-        return RPCGetBalanceResult(**result["result"])
+        balance = self._parse(raw, _BALANCE_ENVELOPE)
+        if balance is None:
+            raise RPCException("Respuesta RPC sin resultado")
+        self._balance_cache[cache_key] = balance
+        return balance
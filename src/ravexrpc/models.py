@@ -4,19 +4,42 @@ Este módulo contiene los modelos Pydantic que representan las estructuras
 de datos retornadas por el RPC de Solana.
 """
 
+from dataclasses import dataclass
+from functools import cached_property
 from typing import Any
 
-from pydantic import BaseModel, Field, field_validator, model_validator
+import numpy as np
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    PrivateAttr,
+    field_validator,
+    model_validator,
+)
+
+from ravexrpc import _fast
 
 
 class APIBaseModel(BaseModel):
     """Clase base para todos los modelos de API.
 
-    Proporciona serialización JSON mejorada con formato legible.
+    Proporciona serialización JSON legible bajo demanda vía `pretty()`.
+
+    El esquema de pydantic-core se compila en el import (defer_build=False)
+    para no pagar el coste en la primera instanciación, y los campos con
+    alias también se aceptan por su nombre Python (populate_by_name=True).
     """
 
-    def __str__(self) -> str:
-        """Retorna una representación JSON formateada del modelo."""
+    model_config = ConfigDict(populate_by_name=True, defer_build=False)
+
+    def pretty(self) -> str:
+        """Retorna una representación JSON formateada del modelo.
+
+        Antes era `__str__`, pero re-serializar todo el modelo en cada
+        `str(model)` accidental (logs, f-strings) resultaba caro; ahora el
+        coste solo se paga cuando se pide explícitamente.
+        """
         return self.model_dump_json(indent=2, ensure_ascii=False)
 
 
@@ -36,6 +59,26 @@ class RPCResponse(APIBaseModel):
     error: dict[str, Any] | None = None
 
 
+class RPCEnvelope[ResultT](APIBaseModel):
+    """Sobre JSON-RPC 2.0 genérico sobre el tipo del resultado.
+
+    Parametrizado con el modelo del `result` permite validar la respuesta
+    completa — sobre y resultado — en una sola pasada de pydantic-core,
+    directamente desde los bytes crudos de la red con model_validate_json.
+
+    Attributes:
+        jsonrpc: Versión del protocolo JSON-RPC
+        id: Identificador de la petición correlacionada
+        result: Resultado tipado de la llamada, None si falló
+        error: Error si la llamada falló, None en caso contrario
+    """
+
+    jsonrpc: str = "2.0"
+    id: int | None = None
+    result: ResultT | None = None
+    error: dict[str, Any] | None = None
+
+
 # -----------------------------------GetTokenAccounts Models-----------------------------------#
 
 
@@ -51,6 +94,11 @@ class RPCTokenAccounts(APIBaseModel):
         frozen: Indica si la cuenta está congelada
     """
 
+    # Una wallet puede tener miles de cuentas: congelar el modelo evita
+    # copias defensivas y deja claro que los items de la lista son de solo
+    # lectura una vez validados
+    model_config = ConfigDict(frozen=True)
+
     address: str
     mint: str
     owner: str
@@ -67,6 +115,37 @@ class RPCTokenAccounts(APIBaseModel):
         return v
 
 
+@dataclass(slots=True)
+class TokenAccountsSoA:
+    """Vista struct-of-arrays de una lista de cuentas de tokens.
+
+    En lugar de un objeto por cuenta (array-of-structs), mantiene columnas
+    paralelas: los montos viven en arrays numpy contiguos, así que las
+    agregaciones (sumas, filtros, máximos) se vectorizan en C en lugar de
+    iterar objetos Python.
+
+    Attributes:
+        addresses: Direcciones de las cuentas de token
+        mints: Mints de cada cuenta
+        owners: Propietarios de cada cuenta
+        amounts: Balances como array numpy int64
+        delegated_amounts: Montos delegados como array numpy int64
+        frozen: Flags de congelación como array numpy bool
+
+    Example:
+        >>> soa = result.as_soa()
+        >>> total = soa.amounts.sum()
+        >>> activas = soa.addresses[0] if (~soa.frozen).any() else None
+    """
+
+    addresses: list[str]
+    mints: list[str]
+    owners: list[str]
+    amounts: np.ndarray
+    delegated_amounts: np.ndarray
+    frozen: np.ndarray
+
+
 class RPCGetTokenAccountsResult(APIBaseModel):
     """Resultado de una consulta de cuentas de tokens.
 
@@ -90,6 +169,38 @@ class RPCGetTokenAccountsResult(APIBaseModel):
             raise ValueError("Total y limit deben ser no negativos")
         return v
 
+    def as_soa(self) -> TokenAccountsSoA:
+        """Convierte la lista de cuentas a formato struct-of-arrays.
+
+        Construye las columnas en una sola pasada sobre `token_accounts`.
+        Útil cuando se van a agregar montos de miles de cuentas.
+
+        Returns:
+            TokenAccountsSoA con columnas paralelas a la lista original.
+        """
+        addresses: list[str] = []
+        mints: list[str] = []
+        owners: list[str] = []
+        amounts: list[int] = []
+        delegated: list[int] = []
+        frozen: list[bool] = []
+        for account in self.token_accounts:
+            addresses.append(account.address)
+            mints.append(account.mint)
+            owners.append(account.owner)
+            amounts.append(account.amount)
+            delegated.append(account.delegated_amount)
+            frozen.append(account.frozen)
+
+        return TokenAccountsSoA(
+            addresses=addresses,
+            mints=mints,
+            owners=owners,
+            amounts=np.asarray(amounts, dtype=np.int64),
+            delegated_amounts=np.asarray(delegated, dtype=np.int64),
+            frozen=np.asarray(frozen, dtype=np.bool_),
+        )
+
 
 # -----------------------------------GetTransaction Models-----------------------------------#
 
@@ -103,35 +214,46 @@ class RPCMetaTransaction(APIBaseModel):
     Attributes:
         post_balances: Balances de las cuentas después de la transacción (lamports)
         pre_balances: Balances de las cuentas antes de la transacción (lamports)
-        delta_balances: Cambios en los balances (post - pre) calculados automáticamente
+        delta_balances: Cambios en los balances (post - pre), calculados de
+            forma perezosa en el primer acceso
     """
 
     post_balances: list[int] = Field(..., alias="postBalances")
     pre_balances: list[int] = Field(..., alias="preBalances")
-    pre_token_balances: list[dict] = Field(..., alias="preTokenBalances")
-    post_token_balances: list[dict] = Field(..., alias="postTokenBalances")
-    delta_balances: list[int] = Field(default_factory=list)
+    pre_token_balances: list[dict] = Field(
+        default_factory=list, alias="preTokenBalances"
+    )
+    post_token_balances: list[dict] = Field(
+        default_factory=list, alias="postTokenBalances"
+    )
 
     @model_validator(mode="after")
-    def calculate_delta_balance(self) -> RPCMetaTransaction:
-        """Calcula automáticamente los cambios de balance para cada cuenta.
+    def validate_balance_lengths(self) -> RPCMetaTransaction:
+        """Valida que pre_balances y post_balances sean comparables.
 
-        delta_balance[i] = post_balances[i] - pre_balances[i]
-
-        Un valor positivo indica que la cuenta recibió lamports.
-        Un valor negativo indica que la cuenta envió lamports.
+        La comprobación de longitud es O(1) y se mantiene en la validación;
+        la resta en sí se difiere hasta que alguien consulte delta_balances.
         """
         if len(self.pre_balances) != len(self.post_balances):
             raise ValueError(
                 "pre_balances y post_balances deben tener la misma longitud"
             )
-
-        self.delta_balances = [
-            post - pre
-            for post, pre in zip(self.post_balances, self.pre_balances, strict=False)
-        ]
         return self
 
+    @cached_property
+    def delta_balances(self) -> list[int]:
+        """Cambios de balance por cuenta, calculados bajo demanda.
+
+        delta_balance[i] = post_balances[i] - pre_balances[i]
+
+        Un valor positivo indica que la cuenta recibió lamports.
+        Un valor negativo indica que la cuenta envió lamports.
+
+        La resta se vectoriza con numpy y el resultado se cachea: los
+        callers que nunca acceden a delta_balances no pagan nada.
+        """
+        return _fast.delta_balances(self.pre_balances, self.post_balances)
+
 
 class RPCMessageModel(APIBaseModel):
     """Mensaje de una transacción de Solana.
@@ -142,6 +264,23 @@ class RPCMessageModel(APIBaseModel):
 
     account_keys: list[str] = Field(..., alias="accountKeys")
 
+    # Índice {clave: posición} construido de forma perezosa en el primer
+    # index_of(); las búsquedas posteriores son O(1) sin re-escanear la lista
+    _key_index: dict[str, int] | None = PrivateAttr(default=None)
+
+    def index_of(self, key: str) -> int | None:
+        """Retorna la posición de `key` en account_keys, o None si no está.
+
+        Args:
+            key: Dirección de la cuenta a buscar (formato base58).
+
+        Returns:
+            Posición de la cuenta en el mensaje, o None si no participa.
+        """
+        if self._key_index is None:
+            self._key_index = _fast.build_key_index(self.account_keys)
+        return self._key_index.get(key)
+
 
 class RPCTransaction(APIBaseModel):
     """Datos de una transacción de Solana.
@@ -198,38 +337,35 @@ class RPCGetTransactionResult(APIBaseModel):
         Los montos se retornan en lamports (unidades mínimas).
         Para convertir a SOL: sol_amount / 1_000_000_000
         """
-        account_keys = self.transaction.message.account_keys
+        # Sin cuentas que buscar no hace falta ni construir el índice
+        if self.to_pk is None and self.from_pk is None:
+            return self
+
+        # El índice perezoso del mensaje resuelve cada búsqueda en O(1) y
+        # queda cacheado para consultas posteriores del caller
+        message = self.transaction.message
+        n_balances = min(len(self.meta.pre_balances), len(self.meta.post_balances))
 
         # Calcular SOL recibido en to_pk
         if self.to_pk is not None:
-            try:
-                index = account_keys.index(self.to_pk)
-                if index < len(self.meta.pre_balances) and index < len(
-                    self.meta.post_balances
-                ):
-                    self.sol_amount = abs(
-                        self.meta.post_balances[index] - self.meta.pre_balances[index]
-                    )
-                else:
-                    self.sol_amount = None
-            except ValueError:
-                # to_pk no está en account_keys
+            index = message.index_of(self.to_pk)
+            if index is not None and index < n_balances:
+                self.sol_amount = abs(
+                    self.meta.post_balances[index] - self.meta.pre_balances[index]
+                )
+            else:
+                # to_pk no está en account_keys o no tiene balances
                 self.sol_amount = None
 
         # Calcular SOL enviado desde from_pk
         if self.from_pk is not None:
-            try:
-                index = account_keys.index(self.from_pk)
-                if index < len(self.meta.pre_balances) and index < len(
-                    self.meta.post_balances
-                ):
-                    self.send_sol_amount = abs(
-                        self.meta.post_balances[index] - self.meta.pre_balances[index]
-                    )
-                else:
-                    self.send_sol_amount = None
-            except ValueError:
-                # from_pk no está en account_keys
+            index = message.index_of(self.from_pk)
+            if index is not None and index < n_balances:
+                self.send_sol_amount = abs(
+                    self.meta.post_balances[index] - self.meta.pre_balances[index]
+                )
+            else:
+                # from_pk no está en account_keys o no tiene balances
                 self.send_sol_amount = None
 
         return self
@@ -297,6 +433,8 @@ class RPCAccountInner(APIBaseModel):
 class RPCValueItem(APIBaseModel):
     """Item individual en la lista `value` de la respuesta getTokenAccountsByOwner."""
 
+    model_config = ConfigDict(frozen=True)
+
     pubkey: str
     account: RPCAccountInner
 
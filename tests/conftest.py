@@ -1,119 +1,211 @@
 """Configuración de pytest y fixtures compartidos."""
 
-from unittest.mock import AsyncMock
+import asyncio
+import inspect
+import types
 
 import pytest
 
 from ravexrpc import RPC_Client
 
 
-@pytest.fixture
+class _FakeFetch:
+    """Stub asíncrono mínimo para reemplazar `_fetch` en los tests.
+
+    AsyncMock paga introspección y grabación de llamadas en cada await;
+    este stub solo guarda la última llamada y devuelve el valor
+    preconfigurado (o delega en side_effect), que es todo lo que los
+    tests consultan. Mantiene la misma interfaz que usan: return_value,
+    side_effect, call_args, call_count, assert_not_called y reset_mock.
+    """
+
+    def __init__(self):
+        self.return_value = None
+        self.side_effect = None
+        self.call_args = None
+        self.call_count = 0
+
+    async def __call__(self, *args, **kwargs):
+        self.call_args = (args, kwargs)
+        self.call_count += 1
+        if self.side_effect is not None:
+            result = self.side_effect(*args, **kwargs)
+            if inspect.isawaitable(result):
+                result = await result
+            return result
+        return self.return_value
+
+    def assert_not_called(self):
+        assert self.call_count == 0, (
+            f"Se esperaba que _fetch no se llamara, pero se llamó "
+            f"{self.call_count} veces"
+        )
+
+    def reset_mock(self, return_value=False, side_effect=False):
+        self.call_args = None
+        self.call_count = 0
+        if return_value:
+            self.return_value = None
+        if side_effect:
+            self.side_effect = None
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_models():
+    """Precalienta la compilación de esquemas de pydantic por worker.
+
+    El primer import de los modelos construye los core schemas; hacerlo
+    una vez en el setup de sesión (por worker de xdist) lo saca de la
+    medición de cualquier test individual. Los `from ravexrpc... import`
+    de cada módulo de test se resuelven después desde sys.modules, así
+    que su coste es un lookup de atributo y pueden mantenerse por
+    legibilidad.
+    """
+    import ravexrpc  # noqa: F401
+    import ravexrpc.client  # noqa: F401
+    import ravexrpc.exceptions  # noqa: F401
+    import ravexrpc.models  # noqa: F401
+
+
+@pytest.fixture(scope="session")
 def mock_client():
-    """Fixture que proporciona un cliente RPC mockeado."""
+    """Fixture que proporciona un cliente RPC compartido por sesión.
+
+    Construir el cliente (pool HTTP, cachés, semáforo) una sola vez por
+    sesión evita repetir ese coste en cada test y refleja el uso real,
+    donde el cliente es un singleton de larga vida.
+    """
     client = RPC_Client()
-    client._fetch = AsyncMock()
-    return client
+    client._fetch = _FakeFetch()
+    yield client
+    asyncio.run(client.close())
+
 
+@pytest.fixture(autouse=True)
+def _reset_mock_client(mock_client):
+    """Aísla los tests: resetea el stub de _fetch y vacía las cachés.
 
-@pytest.fixture
+    reset_mock reutiliza el mismo stub en lugar de construir uno nuevo
+    por test.
+    """
+    mock_client._fetch.reset_mock(return_value=True, side_effect=True)
+    mock_client._balance_cache.clear()
+    mock_client._tx_cache.clear()
+
+
+@pytest.fixture(scope="session")
 def sample_token_accounts_response():
     """Fixture con respuesta de ejemplo para get_token_accounts."""
-    return {
-        "result": {
-            "total": 2,
-            "limit": 10,
-            "cursor": None,
-            "token_accounts": [
-                {
-                    "address": "TokenAccount1Address",
-                    "mint": "EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v",
-                    "owner": "OwnerAddress",
-                    "amount": 1000000,
-                    "delegated_amount": 0,
-                    "frozen": False,
-                },
-                {
-                    "address": "TokenAccount2Address",
-                    "mint": "So11111111111111111111111111111111111111112",
-                    "owner": "OwnerAddress",
-                    "amount": 5000000000,
-                    "delegated_amount": 0,
-                    "frozen": False,
-                },
-            ],
+    return types.MappingProxyType(
+        {
+            "result": {
+                "total": 2,
+                "limit": 10,
+                "cursor": None,
+                "token_accounts": [
+                    {
+                        "address": "TokenAccount1Address",
+                        "mint": "EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v",
+                        "owner": "OwnerAddress",
+                        "amount": 1000000,
+                        "delegated_amount": 0,
+                        "frozen": False,
+                    },
+                    {
+                        "address": "TokenAccount2Address",
+                        "mint": "So11111111111111111111111111111111111111112",
+                        "owner": "OwnerAddress",
+                        "amount": 5000000000,
+                        "delegated_amount": 0,
+                        "frozen": False,
+                    },
+                ],
+            }
         }
-    }
+    )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_transaction_response():
     """Fixture con respuesta de ejemplo para get_transaction."""
-    return {
-        "result": {
-            "meta": {
-                "postBalances": [1000000000, 2000000000, 3000000000],
-                "preBalances": [1500000000, 1500000000, 3000000000],
-            },
-            "transaction": {
-                "message": {
-                    "accountKeys": [
-                        "Account1Address",
-                        "Account2Address",
-                        "Account3Address",
-                    ]
-                }
-            },
+    return types.MappingProxyType(
+        {
+            "result": {
+                "meta": {
+                    "postBalances": [1000000000, 2000000000, 3000000000],
+                    "preBalances": [1500000000, 1500000000, 3000000000],
+                },
+                "transaction": {
+                    "message": {
+                        "accountKeys": [
+                            "Account1Address",
+                            "Account2Address",
+                            "Account3Address",
+                        ]
+                    }
+                },
+            }
         }
-    }
+    )
+
 
+@pytest.fixture(scope="session")
+def sample_balance_response():
+    """Fixture con respuesta de ejemplo para get_balance."""
+    return types.MappingProxyType({"result": {"value": 123456789}})
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def sample_rpc_error():
     """Fixture con respuesta de error RPC."""
-    return {
-        "error": {
-            "code": -32602,
-            "message": "Invalid params: invalid owner address",
+    return types.MappingProxyType(
+        {
+            "error": {
+                "code": -32602,
+                "message": "Invalid params: invalid owner address",
+            }
         }
-    }
+    )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_get_token_accounts_by_owner_response():
     """Fixture con respuesta de ejemplo para getTokenAccountsByOwner."""
-    return {
-        "result": {
-            "context": {"slot": 386954899, "apiVersion": "2.2.7"},
-            "value": [
-                {
-                    "pubkey": "3ACMdmqTvCqM6oxSqhoTauVu7VN6oogNaek7NPYmKtTk",
-                    "account": {
-                        "lamports": 2039280,
-                        "data": {
-                            "program": "spl-token",
-                            "parsed": {
-                                "info": {
-                                    "isNative": False,
-                                    "mint": "DezXAZ8z7PnrnRJjz3wXBoRgixCa6xjnB7YaB1pPB263",
-                                    "owner": "DjQqV6xj8o9sKWbYYqfSXhEBUDsCdTgGwzo3wuvJgDHn",
-                                    "state": "initialized",
-                                    "tokenAmount": {
-                                        "amount": "1382722336",
-                                        "decimals": 5,
-                                        "uiAmount": 13827.22336,
-                                        "uiAmountString": "13827.22336",
+    return types.MappingProxyType(
+        {
+            "result": {
+                "context": {"slot": 386954899, "apiVersion": "2.2.7"},
+                "value": [
+                    {
+                        "pubkey": "3ACMdmqTvCqM6oxSqhoTauVu7VN6oogNaek7NPYmKtTk",
+                        "account": {
+                            "lamports": 2039280,
+                            "data": {
+                                "program": "spl-token",
+                                "parsed": {
+                                    "info": {
+                                        "isNative": False,
+                                        "mint": "DezXAZ8z7PnrnRJjz3wXBoRgixCa6xjnB7YaB1pPB263",
+                                        "owner": "DjQqV6xj8o9sKWbYYqfSXhEBUDsCdTgGwzo3wuvJgDHn",
+                                        "state": "initialized",
+                                        "tokenAmount": {
+                                            "amount": "1382722336",
+                                            "decimals": 5,
+                                            "uiAmount": 13827.22336,
+                                            "uiAmountString": "13827.22336",
+                                        },
                                     },
+                                    "type": "account",
                                 },
-                                "type": "account",
+                                "space": 165,
                             },
+                            "owner": "TokenkegQfeZyiNwAJbNbGKPFXCWuBvf9Ss623VQ5DA",
+                            "executable": False,
+                            "rentEpoch": 18446744073709551615,
                             "space": 165,
                         },
-                        "owner": "TokenkegQfeZyiNwAJbNbGKPFXCWuBvf9Ss623VQ5DA",
-                        "executable": False,
-                        "rentEpoch": 18446744073709551615,
-                        "space": 165,
-                    },
-                }
-            ],
+                    }
+                ],
+            }
         }
-    }
+    )
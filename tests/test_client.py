@@ -1,5 +1,8 @@
 """Tests para el módulo client."""
 
+import asyncio
+
+import httpx
 import pytest
 
 from ravexrpc import RPC_Client
@@ -25,7 +28,6 @@ class TestRPCClient:
 class TestGetTokenAccounts:
     """Tests para el método get_token_accounts."""
 
-    @pytest.mark.asyncio
     async def test_get_token_accounts_success(
         self, mock_client, sample_token_accounts_response
     ):
@@ -41,7 +43,6 @@ class TestGetTokenAccounts:
         assert len(result.token_accounts) == 2
         assert result.token_accounts[0].amount == 1000000
 
-    @pytest.mark.asyncio
     async def test_get_token_accounts_with_mint(
         self, mock_client, sample_token_accounts_response
     ):
@@ -58,7 +59,6 @@ class TestGetTokenAccounts:
         call_args = mock_client._fetch.call_args
         assert "mint" in call_args[1]["payload"]["params"]
 
-    @pytest.mark.asyncio
     async def test_get_token_accounts_with_options(
         self, mock_client, sample_token_accounts_response
     ):
@@ -78,16 +78,16 @@ class TestGetTokenAccounts:
         assert payload["params"]["limit"] == 50
         assert payload["params"]["options"]["showZeroBalance"] is True
 
-    @pytest.mark.asyncio
     async def test_get_token_accounts_invalid_owner(self, mock_client):
         """Test con owner inválido."""
-        with pytest.raises(ValueError, match="cadena válida"):
+        with pytest.raises(ValueError) as exc_info:
             await mock_client.get_token_accounts(owner="")
+        assert "cadena válida" in str(exc_info.value)
 
-        with pytest.raises(ValueError, match="cadena válida"):
+        with pytest.raises(ValueError) as exc_info:
             await mock_client.get_token_accounts(owner=None)
+        assert "cadena válida" in str(exc_info.value)
 
-    @pytest.mark.asyncio
     async def test_get_token_accounts_rpc_error(self, mock_client, sample_rpc_error):
         """Test con error RPC."""
         mock_client._fetch.return_value = sample_rpc_error
@@ -101,7 +101,6 @@ class TestGetTokenAccounts:
 class TestGetTransaction:
     """Tests para el método get_transaction."""
 
-    @pytest.mark.asyncio
     async def test_get_transaction_success(
         self, mock_client, sample_transaction_response
     ):
@@ -109,7 +108,7 @@ class TestGetTransaction:
         mock_client._fetch.return_value = sample_transaction_response
 
         result = await mock_client.get_transaction(
-            signature="5wJG7K9qY1V6P9Z3Y8X9Y8X9Y8X9Y8X9Y8X9Y8X9Y8X9"
+            signature="5wJG7K9qY1V6P9Z3Y8X9Y8X9Y8X9Y8X9Y8X9Y8X9Y8X95wJG7K9qY1V6P9Z3Y8X9Y8X9Y8X9Y8X9Y8X9Y8X9Y8X9"
         )
 
         assert result.meta is not None
@@ -117,7 +116,6 @@ class TestGetTransaction:
         assert len(result.meta.post_balances) == 3
         assert len(result.meta.delta_balances) == 3
 
-    @pytest.mark.asyncio
     async def test_get_transaction_with_accounts(
         self, mock_client, sample_transaction_response
     ):
@@ -125,7 +123,7 @@ class TestGetTransaction:
         mock_client._fetch.return_value = sample_transaction_response
 
         result = await mock_client.get_transaction(
-            signature="5wJG7K9qY1V6P9Z3Y8X9Y8X9Y8X9Y8X9Y8X9Y8X9Y8X9",
+            signature="5wJG7K9qY1V6P9Z3Y8X9Y8X9Y8X9Y8X9Y8X9Y8X9Y8X95wJG7K9qY1V6P9Z3Y8X9Y8X9Y8X9Y8X9Y8X9Y8X9Y8X9",
             from_pk="Account1Address",
             to_pk="Account2Address",
         )
@@ -135,36 +133,87 @@ class TestGetTransaction:
         assert result.send_sol_amount == 500000000
         assert result.sol_amount == 500000000
 
-    @pytest.mark.asyncio
     async def test_get_transaction_invalid_signature(self, mock_client):
         """Test con firma inválida."""
-        with pytest.raises(ValueError, match="cadena válida"):
+        with pytest.raises(ValueError) as exc_info:
             await mock_client.get_transaction(signature="short")
+        assert "cadena válida" in str(exc_info.value)
 
-        with pytest.raises(ValueError, match="cadena válida"):
+        with pytest.raises(ValueError) as exc_info:
             await mock_client.get_transaction(signature=123)
+        assert "cadena válida" in str(exc_info.value)
 
-    @pytest.mark.asyncio
     async def test_get_transaction_rpc_error(self, mock_client, sample_rpc_error):
         """Test con error RPC."""
         mock_client._fetch.return_value = sample_rpc_error
 
         with pytest.raises(RPCException, match="Error RPC"):
             await mock_client.get_transaction(
-                signature="5wJG7K9qY1V6P9Z3Y8X9Y8X9Y8X9Y8X9Y8X9Y8X9Y8X9"
+                signature="5wJG7K9qY1V6P9Z3Y8X9Y8X9Y8X9Y8X9Y8X9Y8X9Y8X95wJG7K9qY1V6P9Z3Y8X9Y8X9Y8X9Y8X9Y8X9Y8X9Y8X9"
             )
 
-    @pytest.mark.asyncio
     async def test_get_transaction_not_found(self, mock_client):
         """Test cuando la transacción no existe."""
         mock_client._fetch.return_value = {"result": None}
 
         with pytest.raises(RPCException, match="no encontrada"):
             await mock_client.get_transaction(
-                signature="5wJG7K9qY1V6P9Z3Y8X9Y8X9Y8X9Y8X9Y8X9Y8X9Y8X9"
+                signature="5wJG7K9qY1V6P9Z3Y8X9Y8X9Y8X9Y8X9Y8X9Y8X9Y8X95wJG7K9qY1V6P9Z3Y8X9Y8X9Y8X9Y8X9Y8X9Y8X9Y8X9"
             )
 
-    @pytest.mark.asyncio
+    async def test_get_transaction_finalized_cached(self, mock_client):
+        """Test que una transacción finalizada se sirve desde la caché."""
+        mock_client._fetch.return_value = {
+            "result": {
+                "meta": {
+                    "postBalances": [1000000000, 2000000000],
+                    "preBalances": [1500000000, 1500000000],
+                    "preTokenBalances": [],
+                    "postTokenBalances": [],
+                },
+                "transaction": {
+                    "message": {"accountKeys": ["Account1Address", "Account2Address"]}
+                },
+            }
+        }
+
+        first = await mock_client.get_transaction(
+            signature="5wJG7K9qY1V6P9Z3Y8X9Y8X9Y8X9Y8X9Y8X9Y8X9Y8X95wJG7K9qY1V6P9Z3Y8X9Y8X9Y8X9Y8X9Y8X9Y8X9Y8X9"
+        )
+        second = await mock_client.get_transaction(
+            signature="5wJG7K9qY1V6P9Z3Y8X9Y8X9Y8X9Y8X9Y8X9Y8X9Y8X95wJG7K9qY1V6P9Z3Y8X9Y8X9Y8X9Y8X9Y8X9Y8X9Y8X9"
+        )
+
+        assert first is second
+        assert mock_client._fetch.call_count == 1
+
+    async def test_get_transaction_processed_not_cached(self, mock_client):
+        """Test que commitments no finalizados no se cachean."""
+        mock_client._fetch.return_value = {
+            "result": {
+                "meta": {
+                    "postBalances": [1000000000, 2000000000],
+                    "preBalances": [1500000000, 1500000000],
+                    "preTokenBalances": [],
+                    "postTokenBalances": [],
+                },
+                "transaction": {
+                    "message": {"accountKeys": ["Account1Address", "Account2Address"]}
+                },
+            }
+        }
+
+        await mock_client.get_transaction(
+            signature="5wJG7K9qY1V6P9Z3Y8X9Y8X9Y8X9Y8X9Y8X9Y8X9Y8X95wJG7K9qY1V6P9Z3Y8X9Y8X9Y8X9Y8X9Y8X9Y8X9Y8X9",
+            commitment="processed",
+        )
+        await mock_client.get_transaction(
+            signature="5wJG7K9qY1V6P9Z3Y8X9Y8X9Y8X9Y8X9Y8X9Y8X9Y8X95wJG7K9qY1V6P9Z3Y8X9Y8X9Y8X9Y8X9Y8X9Y8X9Y8X9",
+            commitment="processed",
+        )
+
+        assert mock_client._fetch.call_count == 2
+
     async def test_get_transaction_with_options(
         self, mock_client, sample_transaction_response
     ):
@@ -172,7 +221,7 @@ class TestGetTransaction:
         mock_client._fetch.return_value = sample_transaction_response
 
         result = await mock_client.get_transaction(
-            signature="5wJG7K9qY1V6P9Z3Y8X9Y8X9Y8X9Y8X9Y8X9Y8X9Y8X9",
+            signature="5wJG7K9qY1V6P9Z3Y8X9Y8X9Y8X9Y8X9Y8X9Y8X9Y8X95wJG7K9qY1V6P9Z3Y8X9Y8X9Y8X9Y8X9Y8X9Y8X9Y8X9",
             encoding="jsonParsed",
             commitment="confirmed",
         )
@@ -187,116 +236,374 @@ class TestGetTransaction:
 class TestGetBalance:
     """Tests para el método get_balance."""
 
-    @pytest.mark.asyncio
-    async def test_get_balance_success(self, mock_client):
+    async def test_get_balance_success(self, mock_client, sample_balance_response):
         """Test exitoso de get_balance."""
-        mock_client._fetch.return_value = {"result": {"value": 123456789}}
+        mock_client._fetch.return_value = sample_balance_response
         result = await mock_client.get_balance(
             pubkey="Dxu2pZyqC1YZxq5bskfDCz2gDPXPGJDQTxjJ4RPVCpnV"
         )
         assert result.value == 123456789
 
-    @pytest.mark.asyncio
     async def test_get_balance_invalid_owner(self, mock_client):
         """Test con owner inválido."""
-        with pytest.raises(ValueError, match="cadena válida"):
+        with pytest.raises(ValueError) as exc_info:
             await mock_client.get_balance(pubkey="")
-        with pytest.raises(ValueError, match="cadena válida"):
+        assert "cadena válida" in str(exc_info.value)
+        with pytest.raises(ValueError) as exc_info:
             await mock_client.get_balance(pubkey=None)
+        assert "cadena válida" in str(exc_info.value)
 
-    @pytest.mark.asyncio
-    async def test_get_balance_rpc_error(self, mock_client):
+    async def test_get_balance_rpc_error(self, mock_client, sample_rpc_error):
         """Test con error RPC."""
-        mock_client._fetch.return_value = {
-            "error": {
-                "code": -32602,
-                "message": "Invalid params: invalid owner address",
-            }
-        }
+        mock_client._fetch.return_value = sample_rpc_error
         with pytest.raises(RPCException, match="Error RPC"):
             await mock_client.get_balance(
                 pubkey="Dxu2pZyqC1YZxq5bskfDCz2gDPXPGJDQTxjJ4RPVCpnV"
             )
 
-    @pytest.mark.asyncio
-    async def test_get_balance_with_commitment(self, mock_client):
+    async def test_get_balance_cached(self, mock_client, sample_balance_response):
+        """Test que una segunda consulta dentro del TTL no toca el RPC."""
+        mock_client._fetch.return_value = sample_balance_response
+
+        first = await mock_client.get_balance(
+            pubkey="Dxu2pZyqC1YZxq5bskfDCz2gDPXPGJDQTxjJ4RPVCpnV"
+        )
+        second = await mock_client.get_balance(
+            pubkey="Dxu2pZyqC1YZxq5bskfDCz2gDPXPGJDQTxjJ4RPVCpnV"
+        )
+
+        assert first.value == second.value == 123456789
+        assert mock_client._fetch.call_count == 1
+
+    async def test_get_balance_with_commitment(
+        self, mock_client, sample_balance_response
+    ):
         """Test de get_balance con parámetro commitment."""
-        mock_client._fetch.return_value = {"result": {"value": 987654321}}
+        mock_client._fetch.return_value = sample_balance_response
         result = await mock_client.get_balance(
             pubkey="Dxu2pZyqC1YZxq5bskfDCz2gDPXPGJDQTxjJ4RPVCpnV",
             commitment="confirmed",
         )
-        assert result.value == 987654321
+        assert result.value == 123456789
         call_args = mock_client._fetch.call_args
         params = call_args[1]["payload"]["params"]
         assert params[0] == "Dxu2pZyqC1YZxq5bskfDCz2gDPXPGJDQTxjJ4RPVCpnV"
         assert params[1]["commitment"] == "confirmed"
 
-    class TestGetTokenAccountsByOwner:
-        """Tests para el método get_token_accounts_by_owner."""
 
-        @pytest.mark.asyncio
-        async def test_get_token_accounts_by_owner_success(
-            self, mock_client, sample_get_token_accounts_by_owner_response
-        ):
-            """Test exitoso de get_token_accounts_by_owner."""
-            mock_client._fetch.return_value = (
-                sample_get_token_accounts_by_owner_response
-            )
+class TestGetTokenAccountsByOwner:
+    """Tests para el método get_token_accounts_by_owner."""
+
+    async def test_get_token_accounts_by_owner_success(
+        self, mock_client, sample_get_token_accounts_by_owner_response
+    ):
+        """Test exitoso de get_token_accounts_by_owner."""
+        mock_client._fetch.return_value = sample_get_token_accounts_by_owner_response
+
+        result = await mock_client.get_token_accounts_by_owner(
+            owner="DjQqV6xj8o9sKWbYYqfSXhEBUDsCdTgGwzo3wuvJgDHn",
+            mint="DezXAZ8z7PnrnRJjz3wXBoRgixCa6xjnB7YaB1pPB263",
+            commitment="confirmed",
+            encoding="jsonParsed",
+        )
+
+        assert result.context.slot == 386954899
+        assert len(result.value) == 1
+        assert result.value[0].pubkey == "3ACMdmqTvCqM6oxSqhoTauVu7VN6oogNaek7NPYmKtTk"
 
-            result = await mock_client.get_token_accounts_by_owner(
+    async def test_get_token_accounts_by_owner_invalid_owner(self, mock_client):
+        """Owner inválido debe lanzar ValueError."""
+        with pytest.raises(ValueError) as exc_info:
+            await mock_client.get_token_accounts_by_owner(owner="")
+        assert "cadena válida" in str(exc_info.value)
+
+    async def test_get_token_accounts_by_owner_rpc_error(
+        self, mock_client, sample_rpc_error
+    ):
+        """Error RPC debe lanzar RPCException."""
+        mock_client._fetch.return_value = sample_rpc_error
+
+        with pytest.raises(RPCException, match="Error RPC"):
+            await mock_client.get_token_accounts_by_owner(
                 owner="DjQqV6xj8o9sKWbYYqfSXhEBUDsCdTgGwzo3wuvJgDHn",
                 mint="DezXAZ8z7PnrnRJjz3wXBoRgixCa6xjnB7YaB1pPB263",
-                commitment="confirmed",
-                encoding="jsonParsed",
             )
 
-            assert result.context.slot == 386954899
-            assert len(result.value) == 1
-            assert (
-                result.value[0].pubkey == "3ACMdmqTvCqM6oxSqhoTauVu7VN6oogNaek7NPYmKtTk"
+    async def test_get_token_accounts_by_owner_payload_structure(
+        self, mock_client, sample_get_token_accounts_by_owner_response
+    ):
+        """Verifica que el payload incluye filter y options correctamente."""
+        mock_client._fetch.return_value = sample_get_token_accounts_by_owner_response
+
+        await mock_client.get_token_accounts_by_owner(
+            owner="DjQqV6xj8o9sKWbYYqfSXhEBUDsCdTgGwzo3wuvJgDHn",
+            mint="DezXAZ8z7PnrnRJjz3wXBoRgixCa6xjnB7YaB1pPB263",
+            commitment="confirmed",
+            encoding="jsonParsed",
+        )
+
+        call_args = mock_client._fetch.call_args
+        payload = call_args[1]["payload"]
+        assert payload["method"] == "getTokenAccountsByOwner"
+        params = payload["params"]
+        assert params[0] == "DjQqV6xj8o9sKWbYYqfSXhEBUDsCdTgGwzo3wuvJgDHn"
+        assert params[1]["mint"] == "DezXAZ8z7PnrnRJjz3wXBoRgixCa6xjnB7YaB1pPB263"
+        assert params[2]["commitment"] == "confirmed"
+        assert params[2]["encoding"] == "jsonParsed"
+
+
+class TestGetBalances:
+    """Tests para el método batch get_balances."""
+
+    async def test_get_balances_success(self, mock_client):
+        """Test exitoso de get_balances con batch."""
+
+        def respond_reversed(method, payload):
+            # Respuestas en orden inverso al de las peticiones
+            return [
+                {"jsonrpc": "2.0", "id": payload[1]["id"], "result": {"value": 222}},
+                {"jsonrpc": "2.0", "id": payload[0]["id"], "result": {"value": 111}},
+            ]
+
+        mock_client._fetch.side_effect = respond_reversed
+
+        results = await mock_client.get_balances(
+            pubkeys=[
+                "DYw8jCTfwHNRJhhmFcbXvVDTqWMEVFBX6ZKUmG5CNSKK",
+                "Dxu2pZyqC1YZxq5bskfDCz2gDPXPGJDQTxjJ4RPVCpnV",
+            ]
+        )
+
+        # Las respuestas llegan desordenadas pero se reordenan por id
+        assert [r.value for r in results] == [111, 222]
+        call_args = mock_client._fetch.call_args
+        payloads = call_args[1]["payload"]
+        ids = [p["id"] for p in payloads]
+        assert len(set(ids)) == len(ids)
+        assert ids == sorted(ids)
+        assert all(p["method"] == "getBalance" for p in payloads)
+
+    async def test_get_balances_empty(self, mock_client):
+        """Test con lista vacía: no debe ir a la red."""
+        results = await mock_client.get_balances(pubkeys=[])
+
+        assert results == []
+        mock_client._fetch.assert_not_called()
+
+    async def test_get_balances_invalid_pubkey(self, mock_client):
+        """Test con una dirección inválida en el lote."""
+        with pytest.raises(ValueError) as exc_info:
+            await mock_client.get_balances(
+                pubkeys=["DYw8jCTfwHNRJhhmFcbXvVDTqWMEVFBX6ZKUmG5CNSKK", ""]
+            )
+        assert "cadena válida" in str(exc_info.value)
+
+    async def test_get_balances_partial_error(self, mock_client):
+        """Test cuando una de las respuestas del lote es un error."""
+
+        def respond_partial_error(method, payload):
+            return [
+                {"jsonrpc": "2.0", "id": payload[0]["id"], "result": {"value": 111}},
+                {
+                    "jsonrpc": "2.0",
+                    "id": payload[1]["id"],
+                    "error": {"code": -32602, "message": "Invalid params"},
+                },
+            ]
+
+        mock_client._fetch.side_effect = respond_partial_error
+
+        with pytest.raises(RPCException, match="Error RPC"):
+            await mock_client.get_balances(
+                pubkeys=[
+                    "DYw8jCTfwHNRJhhmFcbXvVDTqWMEVFBX6ZKUmG5CNSKK",
+                    "Dxu2pZyqC1YZxq5bskfDCz2gDPXPGJDQTxjJ4RPVCpnV",
+                ]
             )
 
-        @pytest.mark.asyncio
-        async def test_get_token_accounts_by_owner_invalid_owner(self, mock_client):
-            """Owner inválido debe lanzar ValueError."""
-            with pytest.raises(ValueError, match="cadena válida"):
-                await mock_client.get_token_accounts_by_owner(owner="")
-
-        @pytest.mark.asyncio
-        async def test_get_token_accounts_by_owner_rpc_error(
-            self, mock_client, sample_rpc_error
-        ):
-            """Error RPC debe lanzar RPCException."""
-            mock_client._fetch.return_value = sample_rpc_error
-
-            with pytest.raises(RPCException, match="Error RPC"):
-                await mock_client.get_token_accounts_by_owner(
-                    owner="DjQqV6xj8o9sKWbYYqfSXhEBUDsCdTgGwzo3wuvJgDHn",
-                    mint="DezXAZ8z7PnrnRJjz3wXBoRgixCa6xjnB7YaB1pPB263",
-                )
-
-        @pytest.mark.asyncio
-        async def test_get_token_accounts_by_owner_payload_structure(
-            self, mock_client, sample_get_token_accounts_by_owner_response
-        ):
-            """Verifica que el payload incluye filter y options correctamente."""
-            mock_client._fetch.return_value = (
-                sample_get_token_accounts_by_owner_response
+    async def test_get_balances_rejected_batch(self, mock_client):
+        """Test cuando el RPC rechaza el lote completo con un solo error."""
+        mock_client._fetch.return_value = {
+            "jsonrpc": "2.0",
+            "id": None,
+            "error": {"code": -32600, "message": "Invalid Request"},
+        }
+
+        with pytest.raises(RPCException, match="Error RPC"):
+            await mock_client.get_balances(
+                pubkeys=["DYw8jCTfwHNRJhhmFcbXvVDTqWMEVFBX6ZKUmG5CNSKK"]
             )
 
-            await mock_client.get_token_accounts_by_owner(
-                owner="DjQqV6xj8o9sKWbYYqfSXhEBUDsCdTgGwzo3wuvJgDHn",
-                mint="DezXAZ8z7PnrnRJjz3wXBoRgixCa6xjnB7YaB1pPB263",
-                commitment="confirmed",
-                encoding="jsonParsed",
+
+class TestGetTransactions:
+    """Tests para el método batch get_transactions."""
+
+    async def test_get_transactions_success(self, mock_client):
+        """Test exitoso de get_transactions con batch."""
+        tx_result = {
+            "meta": {
+                "postBalances": [1000000000, 2000000000],
+                "preBalances": [1500000000, 1500000000],
+                "preTokenBalances": [],
+                "postTokenBalances": [],
+            },
+            "transaction": {
+                "message": {"accountKeys": ["Account1Address", "Account2Address"]}
+            },
+        }
+
+        def respond(method, payload):
+            return [
+                {"jsonrpc": "2.0", "id": p["id"], "result": tx_result} for p in payload
+            ]
+
+        mock_client._fetch.side_effect = respond
+
+        results = await mock_client.get_transactions(
+            signatures=[
+                "5wJG7K9qY1V6P9Z3Y8X9Y8X9Y8X9Y8X9Y8X9Y8X9Y8X95wJG7K9qY1V6P9Z3Y8X9Y8X9Y8X9Y8X9Y8X9Y8X9Y8X9",
+                "6wJG7K9qY1V6P9Z3Y8X9Y8X9Y8X9Y8X9Y8X9Y8X9Y8X96wJG7K9qY1V6P9Z3Y8X9Y8X9Y8X9Y8X9Y8X9Y8X9Y8X9",
+            ]
+        )
+
+        assert len(results) == 2
+        assert results[0].meta.delta_balances == [-500000000, 500000000]
+
+    async def test_get_transactions_invalid_signature(self, mock_client):
+        """Test con una firma inválida en el lote."""
+        with pytest.raises(ValueError) as exc_info:
+            await mock_client.get_transactions(signatures=["short"])
+        assert "cadena válida" in str(exc_info.value)
+
+    async def test_get_transactions_not_found(self, mock_client):
+        """Test cuando una transacción del lote no existe."""
+
+        def respond_not_found(method, payload):
+            return [{"jsonrpc": "2.0", "id": p["id"], "result": None} for p in payload]
+
+        mock_client._fetch.side_effect = respond_not_found
+
+        with pytest.raises(RPCException, match="no encontrada"):
+            await mock_client.get_transactions(
+                signatures=[
+                    "5wJG7K9qY1V6P9Z3Y8X9Y8X9Y8X9Y8X9Y8X9Y8X9Y8X95wJG7K9qY1V6P9Z3Y8X9Y8X9Y8X9Y8X9Y8X9Y8X9Y8X9"
+                ]
             )
 
-            call_args = mock_client._fetch.call_args
-            payload = call_args[1]["payload"]
-            assert payload["method"] == "getTokenAccountsByOwner"
-            params = payload["params"]
-            assert params[0] == "DjQqV6xj8o9sKWbYYqfSXhEBUDsCdTgGwzo3wuvJgDHn"
-            assert params[1]["mint"] == "DezXAZ8z7PnrnRJjz3wXBoRgixCa6xjnB7YaB1pPB263"
-            assert params[2]["commitment"] == "confirmed"
-            assert params[2]["encoding"] == "jsonParsed"
+
+class TestHedging:
+    """Tests para el hedging de peticiones entre varios endpoints."""
+
+    async def test_fetch_hedged_returns_fastest(self):
+        """Test que gana la primera respuesta exitosa."""
+        client = RPC_Client(
+            base_url=["https://rpc-a.example.com", "https://rpc-b.example.com"]
+        )
+
+        async def fake_post(http, index, method, content):
+            if index == 0:
+                await asyncio.sleep(0.05)
+                return {"result": "slow"}
+            return {"result": "fast"}
+
+        client._post_one = fake_post
+
+        result = await client._fetch("POST", payload={})
+
+        assert result == {"result": "fast"}
+        await client.close()
+
+    async def test_fetch_hedged_falls_back_on_error(self):
+        """Test que un endpoint fallido no tumba la petición."""
+        client = RPC_Client(
+            base_url=["https://rpc-a.example.com", "https://rpc-b.example.com"]
+        )
+
+        async def fake_post(http, index, method, content):
+            if index == 0:
+                raise httpx.ConnectError("conexión rechazada")
+            await asyncio.sleep(0.01)
+            return {"result": "ok"}
+
+        client._post_one = fake_post
+
+        result = await client._fetch("POST", payload={})
+
+        assert result == {"result": "ok"}
+        await client.close()
+
+    async def test_single_url_does_not_hedge(self, mock_client):
+        """Test que con una sola URL no se duplican peticiones."""
+        assert len(mock_client._https) == 1
+
+
+class TestRateLimit:
+    """Tests para el reintento automático ante HTTP 429."""
+
+    @staticmethod
+    def _rate_limit_error(retry_after="0"):
+        request = httpx.Request("POST", "https://rpc-a.example.com")
+        response = httpx.Response(
+            429, headers={"Retry-After": retry_after}, request=request
+        )
+        return httpx.HTTPStatusError(
+            "Too Many Requests", request=request, response=response
+        )
+
+    async def test_fetch_retries_on_429(self):
+        """Test que un 429 se reintenta y la petición acaba bien."""
+        client = RPC_Client(base_url="https://rpc-a.example.com")
+        attempts = []
+
+        async def fake_post(http, index, method, content):
+            attempts.append(index)
+            if len(attempts) == 1:
+                raise self._rate_limit_error()
+            return {"result": {"value": 1}}
+
+        client._post_one = fake_post
+
+        result = await client._fetch("POST", payload={})
+
+        assert result == {"result": {"value": 1}}
+        assert len(attempts) == 2
+        await client.close()
+
+    @pytest.mark.parametrize(
+        "retry_after",
+        [
+            pytest.param("Fri, 31 Dec 1999 23:59:59 GMT", id="fecha-http"),
+            pytest.param("no-es-un-numero", id="cabecera-invalida"),
+        ],
+    )
+    async def test_fetch_retries_on_429_with_non_numeric_retry_after(self, retry_after):
+        """Test que Retry-After en formato fecha o inválido no rompe el reintento."""
+        client = RPC_Client(base_url="https://rpc-a.example.com")
+        attempts = []
+
+        async def fake_post(http, index, method, content):
+            attempts.append(index)
+            if len(attempts) == 1:
+                raise self._rate_limit_error(retry_after=retry_after)
+            return {"result": {"value": 1}}
+
+        client._post_one = fake_post
+
+        result = await client._fetch("POST", payload={})
+
+        assert result == {"result": {"value": 1}}
+        assert len(attempts) == 2
+        await client.close()
+
+    async def test_fetch_gives_up_after_max_retries(self):
+        """Test que tras agotar los reintentos se propaga RPCException."""
+        client = RPC_Client(base_url="https://rpc-a.example.com", max_retries=1)
+
+        async def fake_post(http, index, method, content):
+            raise self._rate_limit_error()
+
+        client._post_one = fake_post
+
+        with pytest.raises(RPCException, match="429"):
+            await client._fetch("POST", payload={})
+        await client.close()
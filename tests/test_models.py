@@ -32,6 +32,20 @@ class TestRPCTokenAccounts:
         assert account.amount == 1000000
         assert not account.frozen
 
+    def test_token_account_is_frozen(self):
+        """Test que las cuentas de token son inmutables tras validar."""
+        account = RPCTokenAccounts(
+            address="TokenAddress",
+            mint="MintAddress",
+            owner="OwnerAddress",
+            amount=1000000,
+            delegated_amount=0,
+            frozen=False,
+        )
+
+        with pytest.raises(ValidationError, match="frozen"):
+            account.amount = 0
+
     def test_negative_amount_validation(self):
         """Test de validación de montos negativos."""
         with pytest.raises(ValidationError, match="no negativos"):
@@ -77,6 +91,40 @@ class TestRPCGetTokenAccountsResult:
         assert result.total == 2
         assert len(result.token_accounts) == 2
 
+    def test_as_soa_conversion(self):
+        """Test de conversión a struct-of-arrays."""
+        result = RPCGetTokenAccountsResult(
+            total=2,
+            limit=10,
+            cursor=None,
+            token_accounts=[
+                RPCTokenAccounts(
+                    address="Address1",
+                    mint="Mint1",
+                    owner="Owner1",
+                    amount=1000,
+                    delegated_amount=0,
+                    frozen=False,
+                ),
+                RPCTokenAccounts(
+                    address="Address2",
+                    mint="Mint2",
+                    owner="Owner2",
+                    amount=2000,
+                    delegated_amount=500,
+                    frozen=True,
+                ),
+            ],
+        )
+
+        soa = result.as_soa()
+
+        assert soa.addresses == ["Address1", "Address2"]
+        assert soa.mints == ["Mint1", "Mint2"]
+        assert int(soa.amounts.sum()) == 3000
+        assert int(soa.delegated_amounts.sum()) == 500
+        assert soa.frozen.tolist() == [False, True]
+
     def test_negative_total_validation(self):
         """Test de validación de total negativo."""
         with pytest.raises(ValidationError, match="no negativos"):
@@ -100,6 +148,15 @@ class TestRPCMetaTransaction:
 
         assert meta.delta_balances == [500000000, -500000000, 500000000]
 
+    def test_delta_balance_is_cached(self):
+        """Test que el cálculo perezoso se hace una sola vez."""
+        meta = RPCMetaTransaction(
+            preBalances=[1000000000],
+            postBalances=[1500000000],
+        )
+
+        assert meta.delta_balances is meta.delta_balances
+
     def test_mismatched_balances_length(self):
         """Test con longitudes diferentes de balances."""
         with pytest.raises(ValidationError, match="misma longitud"):
@@ -109,87 +166,113 @@ class TestRPCMetaTransaction:
             )
 
 
+class TestRPCMessageModel:
+    """Tests para el modelo RPCMessageModel."""
+
+    def test_index_of(self):
+        """Test de búsqueda de cuentas por clave."""
+        message = RPCMessageModel(accountKeys=["Account1", "Account2"])
+
+        assert message.index_of("Account1") == 0
+        assert message.index_of("Account2") == 1
+        assert message.index_of("NonExistent") is None
+
+    def test_index_of_reuses_index(self):
+        """Test que el índice se construye una sola vez."""
+        message = RPCMessageModel(accountKeys=["Account1", "Account2"])
+
+        message.index_of("Account1")
+        first_index = message._key_index
+        message.index_of("Account2")
+
+        assert message._key_index is first_index
+
+
+# Submodelos compartidos entre tests: pydantic no re-valida instancias ya
+# construidas (revalidate_instances="never"), así que reutilizar el mismo
+# grafo amortiza la validación entre los tests que no lo mutan
+_TRANSACTION_AB = RPCTransaction(
+    message=RPCMessageModel(accountKeys=["Account1", "Account2"])
+)
+_META_TRANSFER = RPCMetaTransaction(
+    preBalances=[1000000000, 2000000000],
+    postBalances=[1500000000, 1500000000],
+)
+_META_RECEIVED = RPCMetaTransaction(
+    preBalances=[1000000000, 2000000000],
+    postBalances=[1500000000, 2500000000],
+)
+_META_SENT = RPCMetaTransaction(
+    preBalances=[2000000000, 1000000000],
+    postBalances=[1500000000, 1500000000],
+)
+
+
 class TestRPCGetTransactionResult:
     """Tests para el modelo RPCGetTransactionResult."""
 
     def test_valid_transaction(self):
         """Test de transacción válida."""
         tx = RPCGetTransactionResult(
-            meta=RPCMetaTransaction(
-                preBalances=[1000000000, 2000000000],
-                postBalances=[1500000000, 1500000000],
-            ),
-            transaction=RPCTransaction(
-                message=RPCMessageModel(accountKeys=["Account1", "Account2"])
-            ),
+            meta=_META_TRANSFER,
+            transaction=_TRANSACTION_AB,
         )
 
         assert tx.meta.delta_balances == [500000000, -500000000]
 
-    def test_sol_amount_calculation_to_pk(self):
-        """Test de cálculo de SOL recibido con to_pk."""
-        tx = RPCGetTransactionResult(
-            meta=RPCMetaTransaction(
-                preBalances=[1000000000, 2000000000],
-                postBalances=[1500000000, 2500000000],
+    @pytest.mark.parametrize(
+        ("meta", "from_pk", "to_pk", "expected_send", "expected_recv"),
+        [
+            pytest.param(
+                _META_RECEIVED,
+                None,
+                "Account2",
+                None,
+                500000000,
+                id="sol-recibido-en-to_pk",
             ),
-            transaction=RPCTransaction(
-                message=RPCMessageModel(accountKeys=["Account1", "Account2"])
+            pytest.param(
+                _META_SENT,
+                "Account1",
+                None,
+                500000000,
+                None,
+                id="sol-enviado-desde-from_pk",
             ),
-            to_pk="Account2",
-        )
-
-        # Account2: 2000000000 -> 2500000000 (recibió 500000000)
-        assert tx.sol_amount == 500000000
-
-    def test_sol_amount_calculation_from_pk(self):
-        """Test de cálculo de SOL enviado con from_pk."""
-        tx = RPCGetTransactionResult(
-            meta=RPCMetaTransaction(
-                preBalances=[2000000000, 1000000000],
-                postBalances=[1500000000, 1500000000],
-            ),
-            transaction=RPCTransaction(
-                message=RPCMessageModel(accountKeys=["Account1", "Account2"])
-            ),
-            from_pk="Account1",
-        )
-
-        # Account1: 2000000000 -> 1500000000 (envió 500000000)
-        assert tx.send_sol_amount == 500000000
-
-    def test_sol_amount_with_invalid_to_account(self):
-        """Test con cuenta que no existe en account_keys."""
-        tx = RPCGetTransactionResult(
-            meta=RPCMetaTransaction(
-                preBalances=[1000000000, 2000000000],
-                postBalances=[1500000000, 1500000000],
+            pytest.param(
+                _META_TRANSFER,
+                None,
+                "NonExistentAccount",
+                None,
+                None,
+                id="to_pk-inexistente",
             ),
-            transaction=RPCTransaction(
-                message=RPCMessageModel(accountKeys=["Account1", "Account2"])
+            pytest.param(
+                _META_TRANSFER,
+                "NonExistentAccount",
+                None,
+                None,
+                None,
+                id="from_pk-inexistente",
             ),
-            to_pk="NonExistentAccount",
-        )
-
-        assert tx.sol_amount is None
-
-    def test_sol_amount_with_invalid_from_account(self):
-        """Test con cuenta que no existe en account_keys."""
+        ],
+    )
+    def test_sol_amount_calculation(
+        self, meta, from_pk, to_pk, expected_send, expected_recv
+    ):
+        """Test del cálculo de montos de SOL según to_pk/from_pk."""
         tx = RPCGetTransactionResult(
-            meta=RPCMetaTransaction(
-                preBalances=[1000000000, 2000000000],
-                postBalances=[1500000000, 1500000000],
-            ),
-            transaction=RPCTransaction(
-                message=RPCMessageModel(accountKeys=["Account1", "Account2"])
-            ),
-            from_pk="NonExistentAccount",
+            meta=meta,
+            transaction=_TRANSACTION_AB,
+            from_pk=from_pk,
+            to_pk=to_pk,
         )
 
-        assert tx.send_sol_amount is None
+        assert tx.send_sol_amount == expected_send
+        assert tx.sol_amount == expected_recv
 
-    def test_str_representation(self):
-        """Test de representación string del modelo."""
+    def test_pretty_representation(self):
+        """Test de representación JSON formateada del modelo."""
         tx = RPCGetTransactionResult(
             meta=RPCMetaTransaction(
                 preBalances=[1000000000],
@@ -200,11 +283,11 @@ class TestRPCGetTransactionResult:
             ),
         )
 
-        str_repr = str(tx)
-        assert "meta" in str_repr
-        assert "transaction" in str_repr
+        pretty_repr = tx.pretty()
+        assert "meta" in pretty_repr
+        assert "transaction" in pretty_repr
         # Debe ser JSON formateado
-        assert "\n" in str_repr
+        assert "\n" in pretty_repr
 
 
 class TestRPCGetBalanceResult: